@@ -0,0 +1,46 @@
+from bisect import bisect_right
+
+
+class IntervalIndex:
+
+    """
+    A set of integers described by ranges.
+    Overlapping and touching ranges are merged once up front, which leaves sorted, disjoint intervals
+    that can be searched with bisect instead of scanning every range.
+    """
+
+    def __init__(self, ranges):
+        self._starts, self._stops = [], []
+        for r in sorted(ranges, key=lambda x: x.start):
+            if self._stops and r.start <= self._stops[-1]:
+                self._stops[-1] = max(self._stops[-1], r.stop)
+            else:
+                self._starts.append(r.start)
+                self._stops.append(r.stop)
+
+    def __contains__(self, value):
+        i = bisect_right(self._starts, value) - 1
+        return i >= 0 and value < self._stops[i]
+
+    def __iter__(self):
+        for start, stop in zip(self._starts, self._stops):
+            yield range(start, stop)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def count_members(self, values):
+        """
+        Count how many of `values` fall inside the index.
+        The values are sorted and swept against the intervals in a single pass,
+        which beats a bisect per value when there are lots of them.
+        """
+        result, i = 0, 0
+        for value in sorted(values):
+            while i < len(self._stops) and self._stops[i] <= value:
+                i += 1
+            if i == len(self._stops):
+                break
+            if self._starts[i] <= value:
+                result += 1
+        return result
@@ -0,0 +1,33 @@
+import numpy as np
+
+
+def parse_rotations(data):
+    """
+    Parse a whole rotation log (raw bytes, e.g. an mmap) into a signed int64 array in one pass.
+    Right turns are positive and left turns negative.
+
+    Every digit is weighted by its place value within its line, then reduceat sums the
+    weighted digits line by line, so no per-line Python work is done.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    digit_positions = np.flatnonzero((buf >= ord('0')) & (buf <= ord('9')))
+    if len(digit_positions) == 0:
+        return np.zeros(0, dtype=np.int64)
+    newlines = np.flatnonzero(buf == ord('\n'))
+    _, first_digits, line_numbers = np.unique(
+        np.searchsorted(newlines, digit_positions), return_index=True, return_inverse=True)
+    last_digits = np.append(first_digits[1:], len(digit_positions)) - 1
+
+    place_values = np.power(10, digit_positions[last_digits][line_numbers] - digit_positions, dtype=np.int64)
+    weighted = (buf[digit_positions] - ord('0')).astype(np.int64) * place_values
+    clicks = np.add.reduceat(weighted, first_digits)
+    directions = buf[digit_positions[first_digits] - 1]
+    signs = np.where(directions == ord('R'), 1, -1)
+    return signs * clicks
+
+
+def get_positions(rotations, start=50):
+    """
+    The dial position after each rotation.
+    """
+    return (start + np.cumsum(rotations)) % 100
@@ -5,6 +5,8 @@ rotation_pattern = re.compile(r"""
     ([1-9][0-9]*)   # number of clicks
 """, re.VERBOSE)
 
+input_mode = 'stream'
+
 
 def run(lines):
     result = 0
@@ -0,0 +1,10 @@
+import numpy as np
+
+from day01.rotations import get_positions, parse_rotations
+
+input_mode = 'mmap'
+
+
+def run(data):
+    positions = get_positions(parse_rotations(data))
+    return int(np.count_nonzero(positions == 0))
@@ -5,6 +5,8 @@ rotation_pattern = re.compile(r"""
     ([1-9][0-9]*)   # number of clicks
 """, re.VERBOSE)
 
+input_mode = 'stream'
+
 
 def run(lines):
     result = 0
@@ -12,8 +14,31 @@ def run(lines):
     for line in lines:
         match = rotation_pattern.fullmatch(line)
         direction, clicks = 1 if match.group(1) == 'R' else -1, int(match.group(2))
-        for _ in range(clicks):
-            position = (position + direction) % 100
-            if position == 0:
-                result += 1
+        result += count_zero_hits(position, direction, clicks)
+        position = (position + direction * clicks) % 100
+    return result
+
+
+def count_zero_hits(position, direction, clicks):
+    """
+    Count how many of the `clicks` steps land the dial on 0, without stepping through them.
+    Unwrapped, the dial visits position + 1 .. position + clicks going right, or
+    position - clicks .. position - 1 going left. Each multiple of 100 in that span is a hit,
+    and floor division counts them directly (Python's // rounds toward minus infinity, so it
+    works for negative positions too).
+    """
+    if direction == 1:
+        return (position + clicks) // 100
+    return (position - 1) // 100 - (position - clicks - 1) // 100
+
+
+def count_zero_hits_by_stepping(position, direction, clicks):
+    """
+    The original one-click-at-a-time implementation, kept as a reference to check count_zero_hits against.
+    """
+    result = 0
+    for _ in range(clicks):
+        position = (position + direction) % 100
+        if position == 0:
+            result += 1
     return result
\ No newline at end of file
@@ -0,0 +1,19 @@
+import numpy as np
+
+from day01.rotations import get_positions, parse_rotations
+
+input_mode = 'mmap'
+
+
+def run(data):
+    """
+    Vectorized version of count_zero_hits from solution2: each rotation starts where the previous one ended,
+    and the multiples of 100 it passes over are counted with floor division on the unwrapped position.
+    """
+    rotations = parse_rotations(data)
+    ends = get_positions(rotations)
+    starts = np.concatenate(([50], ends[:-1]))
+    clicks = np.abs(rotations)
+    right_hits = (starts + clicks) // 100
+    left_hits = (starts - 1) // 100 - (starts - clicks - 1) // 100
+    return int(np.where(rotations > 0, right_hits, left_hits).sum())
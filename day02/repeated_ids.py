@@ -0,0 +1,58 @@
+import itertools
+
+
+def sum_repeated_ids(low, high, length, period):
+    """
+    Sum every `length`-digit number in [low, high] made of a `period`-digit block repeated.
+    Those numbers are block * multiplier, where the multiplier is the repunit 1 0..01 0..01,
+    so the valid blocks form a contiguous run and their sum is an arithmetic series.
+    """
+    multiplier = (10 ** length - 1) // (10 ** period - 1)
+    first = max(-(-low // multiplier), 10 ** (period - 1))
+    last = min(high // multiplier, 10 ** period - 1)
+    if first > last:
+        return 0
+    return multiplier * (first + last) * (last - first + 1) // 2
+
+
+def split_by_length(low, high):
+    """
+    Split [low, high] into sub-ranges whose numbers all have the same number of digits.
+    Yield (length, low, high) for each one.
+    """
+    for length in range(len(str(low)), len(str(high)) + 1):
+        yield length, max(low, 10 ** (length - 1)), min(high, 10 ** length - 1)
+
+
+def sum_periodic_ids(low, high, length):
+    """
+    Sum every `length`-digit number in [low, high] made of some block repeated at least twice.
+
+    A number repeats with period d exactly when it repeats with every multiple of d that divides the length,
+    so it is enough to look at the periods length / p for each prime p dividing the length.
+    Those sets overlap (the numbers periodic under two of them are periodic under their gcd),
+    so combine them with inclusion-exclusion rather than collecting the IDs in a set.
+    """
+    primes = prime_factors(length)
+    result = 0
+    for size in range(1, len(primes) + 1):
+        sign = 1 if size % 2 == 1 else -1
+        for subset in itertools.combinations(primes, size):
+            period = length
+            for p in subset:
+                period //= p
+            result += sign * sum_repeated_ids(low, high, length, period)
+    return result
+
+
+def prime_factors(n):
+    result, p = [], 2
+    while p * p <= n:
+        if n % p == 0:
+            result.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        result.append(n)
+    return result
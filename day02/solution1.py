@@ -1,22 +1,21 @@
-from itertools import count
+from common.intervals import IntervalIndex
+from day02.repeated_ids import split_by_length, sum_repeated_ids
+
 
 def run(lines):
     result = 0
-    ranges, max_value = get_ranges(lines)
-    for i in count(1):
-        candidate = int(f'{i}{i}')
-        if candidate > max_value:
-            break
-        if any(candidate in r for r in ranges):
-            result += candidate
+    for r in IntervalIndex(get_ranges(lines)):
+        for length, low, high in split_by_length(r.start, r.stop - 1):
+            if length % 2 == 0:
+                result += sum_repeated_ids(low, high, length, length // 2)
     return result
 
 
 def get_ranges(lines):
-    ranges, max_value = [], 0
+    ranges = []
     for r in lines[0].split(','):
         a, b = r.split('-')
         a, b = int(a), int(b)
         ranges.append(range(a, b + 1))
-        max_value = max(max_value, b)
-    return ranges, max_value
+    return ranges
+
@@ -1,30 +1,20 @@
-from itertools import count
+from common.intervals import IntervalIndex
+from day02.repeated_ids import split_by_length, sum_periodic_ids
 
 
 def run(lines):
-    ranges, max_value = get_ranges(lines)
-    invalid_ids = set()
-    for repeat in count(2):
-        if get_candidate(1, repeat) > max_value:
-            break
-        for value in count(1):
-            candidate = get_candidate(value, repeat)
-            if candidate > max_value:
-                break
-            if any(candidate in r for r in ranges):
-                invalid_ids.add(candidate)
-    return sum(invalid_ids)
+    result = 0
+    for r in IntervalIndex(get_ranges(lines)):
+        for length, low, high in split_by_length(r.start, r.stop - 1):
+            result += sum_periodic_ids(low, high, length)
+    return result
 
 
 def get_ranges(lines):
-    ranges, max_value = [], 0
+    ranges = []
     for r in lines[0].split(','):
         a, b = r.split('-')
         a, b = int(a), int(b)
         ranges.append(range(a, b + 1))
-        max_value = max(max_value, b)
-    return ranges, max_value
+    return ranges
 
-
-def get_candidate(value, repeat):
-    return int(str(value) * repeat)
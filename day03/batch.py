@@ -0,0 +1,99 @@
+import concurrent.futures
+
+import numpy as np
+
+
+def total_joltage(data, battery_size, chunk_rows=4096, workers=None):
+    """
+    Sum the maximum joltage of every bank in `data` (raw bytes, e.g. an mmap).
+    Banks of equal length are treated as 2D uint8 arrays and processed in chunks of rows on a thread pool;
+    NumPy releases the GIL for the heavy lifting so the chunks genuinely run in parallel.
+    Each chunk is only copied out of the buffer by the thread that processes it, so memory stays bounded by
+    the chunks in flight rather than growing with the input.
+    Joltages are built in int64, so `battery_size` can be at most 18.
+    """
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        futures = []
+        for banks in get_banks(data):
+            for i in range(0, len(banks), chunk_rows):
+                futures.append(executor.submit(calculate_chunk, banks, i, i + chunk_rows, battery_size))
+        return sum(f.result() for f in futures)
+
+
+def calculate_chunk(banks, start, stop, battery_size):
+    digits = banks[start:stop] - np.uint8(ord('0'))
+    return int(calculate_joltages(digits, battery_size).sum())
+
+
+def get_banks(data):
+    """
+    Split the input into lines and yield the banks of each distinct line length as a (lines, length) array
+    of ASCII digits that can be sliced by rows.
+    When every line has the same length (the usual case) that's just a strided view of the buffer, as in
+    day04/dense.py; otherwise rows are gathered from the buffer a slice at a time.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if not len(buf):
+        return
+    newlines = find_newlines(buf)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(buf)]))
+    ends -= (ends > starts) & (buf[np.maximum(ends - 1, 0)] == ord('\r'))
+    lengths = ends - starts
+    starts, lengths = starts[lengths > 0], lengths[lengths > 0]
+    if not len(starts):
+        return
+    stride = int(starts[1] - starts[0]) if len(starts) > 1 else 0
+    if (lengths == lengths[0]).all() and (starts == np.arange(len(starts)) * stride).all():
+        yield np.lib.stride_tricks.as_strided(buf, shape=(len(starts), int(lengths[0])), strides=(stride, 1),
+                                              writeable=False)
+        return
+    for length in np.unique(lengths):
+        yield GatheredBanks(buf, starts[lengths == length], int(length))
+
+
+def find_newlines(buf, block_bytes=1 << 20):
+    """
+    The positions of every newline in `buf`, scanned a block at a time so no input-sized temporary is needed.
+    """
+    blocks = [np.flatnonzero(buf[i:i + block_bytes] == ord('\n')) + i for i in range(0, len(buf), block_bytes)]
+    return np.concatenate(blocks) if blocks else np.empty(0, dtype=np.intp)
+
+
+class GatheredBanks:
+
+    """
+    Banks of one length scattered through the buffer. Slicing gathers just those rows.
+    """
+
+    def __init__(self, buf, starts, length):
+        self._buf, self._starts, self._length = buf, starts, length
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, rows):
+        return self._buf[self._starts[rows, None] + np.arange(self._length)]
+
+
+def calculate_joltages(banks, battery_size):
+    """
+    The maximum joltage of each row in `banks`.
+
+    Two batteries is just the best first digit followed by the best digit after it, which a suffix-max
+    array gives for every position at once. Larger batteries pick digits greedily like the scalar version:
+    for each output digit, mask every row's digits down to its allowed window and take the first argmax.
+    """
+    rows, width = banks.shape
+    if battery_size == 2:
+        suffix_max = np.maximum.accumulate(banks[:, ::-1], axis=1)[:, ::-1]
+        return (banks[:, :-1].astype(np.int64) * 10 + suffix_max[:, 1:]).max(axis=1)
+    result = np.zeros(rows, dtype=np.int64)
+    start, cols, row_index = np.zeros(rows, dtype=np.intp), np.arange(width), np.arange(rows)
+    for i in range(battery_size):
+        stop = width - battery_size + i
+        window = (cols >= start[:, None]) & (cols <= stop)
+        index = np.where(window, banks, np.int8(-1)).argmax(axis=1)
+        result = result * 10 + banks[row_index, index]
+        start = index + 1
+    return result
@@ -0,0 +1,27 @@
+def calculate_maximum_joltage(line, battery_size):
+    """
+    Find the maximum `battery_size`-digit number you can create from `line` by dropping characters.
+
+    Walk the digits once, keeping a stack of the digits chosen so far. While we can still afford to drop
+    digits, any smaller digit on top of the stack is dropped in favour of the current, larger one,
+    since a bigger digit earlier always beats anything that could come after it.
+    Every digit is pushed and popped at most once, so this is O(n) whatever the battery size.
+    """
+    drops, stack = len(line) - battery_size, []
+    for digit in line:
+        while drops and stack and stack[-1] < digit:
+            stack.pop()
+            drops -= 1
+        stack.append(digit)
+    return digits_to_int(''.join(stack[:battery_size]))
+
+
+def digits_to_int(digits, chunk_size=1000):
+    """
+    int() refuses strings longer than sys.get_int_max_str_digits(), so convert very long ones a chunk at a time.
+    """
+    result = 0
+    for i in range(0, len(digits), chunk_size):
+        chunk = digits[i:i + chunk_size]
+        result = result * 10 ** len(chunk) + int(chunk)
+    return result
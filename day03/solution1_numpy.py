@@ -0,0 +1,7 @@
+from day03 import batch
+
+input_mode = 'mmap'
+
+
+def run(data):
+    return batch.total_joltage(data, 2)
@@ -0,0 +1,38 @@
+roll_bits = str.maketrans('@.', '10')
+
+
+def get_paper_roll_rows(lines):
+    """
+    Load the map as one int per row, with a set bit wherever there's a roll.
+    Return the rows and a mask covering the width of the grid.
+    Which end of the row is the low bit doesn't matter, since neighbours are counted symmetrically.
+    """
+    rows, width = [], 0
+    for line in lines:
+        width = max(width, len(line))
+        rows.append(int(line.translate(roll_bits) or '0', 2))
+    return rows, (1 << width) - 1
+
+
+def get_accessible(rows, index, mask):
+    """
+    Return the rolls in row `index` that have fewer than four neighbouring rolls.
+
+    Each of the eight neighbour directions is a shifted copy of the row above, the row itself or the row below.
+    They're summed bit-parallel, every column at once, with a two-bit ripple counter whose carry out
+    latches into a third bit once the count reaches four.
+    """
+    row = rows[index]
+    above = rows[index - 1] if index > 0 else 0
+    below = rows[index + 1] if index + 1 < len(rows) else 0
+    ones, twos, at_least_four = 0, 0, 0
+    for neighbors in (
+        (above << 1) & mask, above, above >> 1,
+        (row << 1) & mask, row >> 1,
+        (below << 1) & mask, below, below >> 1,
+    ):
+        carry = ones & neighbors
+        ones ^= neighbors
+        at_least_four |= twos & carry
+        twos ^= carry
+    return row & ~at_least_four
@@ -0,0 +1,32 @@
+import numpy as np
+
+
+def get_paper_roll_grid(data):
+    """
+    Load the map (raw bytes, e.g. an mmap) into a boolean array that is True wherever there's a roll.
+    Every row has the same width, so the bytes can be viewed as a 2D array without splitting lines.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == ord('\n'))
+    width = int(newlines[0]) if len(newlines) else len(buf)
+    line_ending = b'\r\n' if width and buf[width - 1] == ord('\r') else b'\n'
+    width -= len(line_ending) - 1
+    if not len(buf) or buf[-1] != ord('\n'):
+        buf = np.concatenate((buf, np.frombuffer(line_ending, dtype=np.uint8)))
+    stride = width + len(line_ending)
+    return buf.reshape(-1, stride)[:, :width] == ord('@')
+
+
+def count_adjacent_rolls(grid):
+    """
+    Count the rolls in the eight cells around every cell at once,
+    by summing eight shifted views of the zero-padded grid (a 3x3 convolution without the centre).
+    """
+    padded = np.pad(grid, 1).astype(np.uint8)
+    rows, cols = grid.shape
+    result = np.zeros(grid.shape, dtype=np.uint8)
+    for i in range(3):
+        for j in range(3):
+            if i != 1 or j != 1:
+                result += padded[i:i + rows, j:j + cols]
+    return result
@@ -0,0 +1,8 @@
+from day04.bitboard import get_accessible, get_paper_roll_rows
+
+input_mode = 'stream'
+
+
+def run(lines):
+    rows, mask = get_paper_roll_rows(lines)
+    return sum(get_accessible(rows, i, mask).bit_count() for i in range(len(rows)))
@@ -0,0 +1,11 @@
+import numpy as np
+
+from day04.dense import count_adjacent_rolls, get_paper_roll_grid
+
+input_mode = 'mmap'
+
+
+def run(data):
+    grid = get_paper_roll_grid(data)
+    adjacent_count = count_adjacent_rolls(grid)
+    return int(np.count_nonzero(grid & (adjacent_count < 4)))
@@ -2,21 +2,33 @@ from collections import defaultdict
 
 
 def run(lines):
-    result = 0
     locations = get_paper_roll_locations(lines)
     adjacent_count = count_adjacent_rolls(locations)
-    any_changes = True
-    while any_changes:
-        any_changes, remaining_locations = False, set()
-        for location in locations:
-            if adjacent_count[location] < 4:
-                result += 1
-                any_changes = True
-                decrement_neighbors(location, adjacent_count)
-            else:
-                remaining_locations.add(location)
-        locations = remaining_locations
-    return result
+    return remove_accessible_rolls(locations, adjacent_count)
+
+
+def remove_accessible_rolls(locations, adjacent_count, wave_sizes=None):
+    """
+    Keep removing rolls with fewer than four neighbours until none are left, and return how many were removed.
+    Instead of rescanning every roll after each pass, start from the rolls that are accessible now and,
+    as each is removed, decrement just its neighbours. A neighbour only becomes accessible at the moment
+    its count drops from 4 to 3, so that is the only time it needs to join the next wave.
+    Pass a list as `wave_sizes` to record how many rolls each wave removed.
+    """
+    wave = [location for location in locations if adjacent_count[location] < 4]
+    removed = set(wave)
+    while wave:
+        if wave_sizes is not None:
+            wave_sizes.append(len(wave))
+        next_wave = []
+        for location in wave:
+            for neighbor in get_neighbors(*location):
+                adjacent_count[neighbor] -= 1
+                if adjacent_count[neighbor] == 3 and neighbor in locations and neighbor not in removed:
+                    removed.add(neighbor)
+                    next_wave.append(neighbor)
+        wave = next_wave
+    return len(removed)
 
 
 def get_paper_roll_locations(lines):
@@ -44,7 +56,3 @@ def get_neighbors(row, col):
     result.remove((row, col))
     return result
 
-
-def decrement_neighbors(location, totals):
-    for neighbor in get_neighbors(*location):
-        totals[neighbor] -= 1
@@ -0,0 +1,25 @@
+from day04.bitboard import get_accessible, get_paper_roll_rows
+
+input_mode = 'stream'
+
+
+def run(lines):
+    """
+    Remove every accessible roll in waves.
+    A removal can only make rolls accessible in its own row or the rows either side,
+    so each wave only re-examines the rows around the previous wave's removals.
+    """
+    result = 0
+    rows, mask = get_paper_roll_rows(lines)
+    candidates = range(len(rows))
+    while candidates:
+        removals = {}
+        for i in candidates:
+            accessible = get_accessible(rows, i, mask)
+            if accessible:
+                removals[i] = accessible
+        for i, accessible in removals.items():
+            rows[i] ^= accessible
+            result += accessible.bit_count()
+        candidates = sorted({j for i in removals for j in (i - 1, i, i + 1) if 0 <= j < len(rows)})
+    return result
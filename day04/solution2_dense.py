@@ -0,0 +1,22 @@
+import numpy as np
+
+from day04.dense import count_adjacent_rolls, get_paper_roll_grid
+
+input_mode = 'mmap'
+
+
+def run(data):
+    """
+    Remove every accessible roll in waves. Rather than recounting the whole grid after each wave,
+    subtract the neighbour counts of just the rolls that were removed.
+    """
+    result = 0
+    grid = get_paper_roll_grid(data)
+    adjacent_count = count_adjacent_rolls(grid)
+    removable = grid & (adjacent_count < 4)
+    while removable.any():
+        result += int(np.count_nonzero(removable))
+        grid &= ~removable
+        adjacent_count -= count_adjacent_rolls(removable)
+        removable = grid & (adjacent_count < 4)
+    return result
@@ -1,25 +1,29 @@
-from collections import defaultdict
+from common.intervals import IntervalIndex
+
+input_mode = 'stream'
 
 
 def run(lines):
     result = 0
     ranges, ingredients = parse_input(lines)
+    fresh = IntervalIndex(ranges)
     for i in ingredients:
-        if any(i in r for r in ranges):
+        if i in fresh:
             result += 1
     return result
 
 
 def parse_input(lines):
-    mode, ranges, ingredients = 'ranges', [], []
+    """
+    Read the ranges eagerly, but hand back the ingredients as a lazy iterator
+    so a streamed input never has to be held in memory all at once.
+    """
+    lines, ranges = iter(lines), []
     for line in lines:
         if line == '':
-            mode = 'ingredients'
-        else:
-            if mode == 'ranges':
-                start, end = line.split('-')
-                start, end = int(start), int(end)
-                ranges.append(range(start, end + 1))
-            else:
-                ingredients.append(int(line))
-    return ranges, ingredients                
+            break
+        start, end = line.split('-')
+        start, end = int(start), int(end)
+        ranges.append(range(start, end + 1))
+    ingredients = (int(line) for line in lines if line)
+    return ranges, ingredients
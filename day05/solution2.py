@@ -1,9 +1,15 @@
+from operator import attrgetter
+
+
 class Range:
 
     """
     min and max on native python ranges are too slow so created this class instead.
+    Uses __slots__ to keep millions of instances compact.
     """
 
+    __slots__ = ('_start', '_stop')
+
     def __init__(self, start, stop):
         self._start = start
         self._stop = stop
@@ -50,25 +56,17 @@ def parse_input(lines):
 def consolidate_ranges(ranges):
     """
     Merge overlapping ranges until no overlapping ranges remain.
+    Once sorted by start, a range can only overlap the range currently being built, so one sweep is enough.
+    The current range is tracked as plain ints and only turned into a Range once it is finished.
     """
-    any_changes = True
-    while any_changes:
-        any_changes = False
-        r1_idx, r2_idx = find_overlap(ranges)
-        if r1_idx is not None:
-            r1, r2 = ranges[r1_idx], ranges[r2_idx]
-            ranges = [r for idx, r in enumerate(ranges) if idx not in (r1_idx, r2_idx)]
-            ranges.append(r1.merge(r2))
-            any_changes = True
-    return ranges
-
-
-def find_overlap(ranges):
-    """
-    Find the indexes of any two overlapping ranges. 
-    """
-    for i in range(len(ranges)):
-        for j in range(i + 1, len(ranges)):
-            if ranges[i].overlaps(ranges[j]):
-                return i, j
-    return None, None
+    result, start, stop = [], None, None
+    for r in sorted(ranges, key=attrgetter('start')):
+        if stop is not None and r.start <= stop + 1:
+            stop = max(stop, r.stop)
+        else:
+            if stop is not None:
+                result.append(Range(start, stop))
+            start, stop = r.start, r.stop
+    if stop is not None:
+        result.append(Range(start, stop))
+    return result
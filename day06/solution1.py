@@ -1,29 +1,40 @@
-import math
-
 class Columns:
-
-    def __init__(self):
-        self._rows = []
+    """
+    Reduces rows of numbers column by column as they arrive.
+    The operators are known up front, so each column only keeps the one running total it needs:
+    a sum for '+' columns and a product for '*' columns.
+    """
+    def __init__(self, operators):
+        self._operators = list(operators)
+        self._totals = [0 if operator == '+' else 1 for operator in self._operators]
 
     def add_row(self, row):
-        self._rows.append(row)
+        totals = self._totals
+        for col, (operator, x) in enumerate(zip(self._operators, row)):
+            if operator == '+':
+                totals[col] += int(x)
+            else:
+                totals[col] *= int(x)
 
-    def __getitem__(self, col):
-        return [row[col] for row in self._rows]
-    
-    def __len__(self):
-        return len(self._rows[0])
+    def total(self):
+        return sum(self._totals)
 
 
 def run(lines):
-    result = 0
-    columns = Columns()
+    operators = get_operators(lines)
+    columns = Columns(operators)
     for line in lines:
-        columns.add_row(line.split())
-    for col in range(len(columns)):
-        column = columns[col]
-        operator = column[-1]
-        numbers = [int(x) for x in column[:-1]]
-        temp = sum(numbers) if operator == '+' else math.prod(numbers)
-        result += temp
-    return result
+        row = line.split()
+        if row and row[0] not in ('+', '*'):
+            columns.add_row(row)
+    return columns.total()
+
+
+def get_operators(lines):
+    """
+    The operators are on the last non-blank line.
+    """
+    for line in reversed(lines):
+        if line.strip():
+            return line.split()
+    return []
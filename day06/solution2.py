@@ -1,54 +1,55 @@
 import math
 
+input_mode = 'stream'
+
 
 class Columns:
     """
-    Accumulates rows of data and allows you to read the data back by column.
+    Reads the worksheet one row at a time and builds the number written vertically in each
+    character column as it goes, so the rows never need to be kept around.
+    Digits are folded in top to bottom (value * 10 + digit) and blanks are skipped.
     """
     def __init__(self):
-        self._rows = []
+        self._values = []
 
     def add_row(self, row):
-        self._rows.append(row)
+        values = self._values
+        if len(row) > len(values):
+            values.extend([0] * (len(row) - len(values)))
+        for col, char in enumerate(row):
+            if char != ' ':
+                values[col] = values[col] * 10 + ord(char) - 48
 
     def __getitem__(self, col):
-        return [row[col] for row in self._rows]
+        return self._values[col]
 
     def __len__(self):
-        return len(self._rows[0])
+        return len(self._values)
 
 
 def run(lines):
-    result = 0
-    for problem in get_problems(lines):
-        operator = problem[-1][0]
-        numbers = extract_numbers(problem)
-        temp = sum(numbers) if operator == '+' else math.prod(numbers)
-        result += temp
+    result, columns, operators = 0, Columns(), ''
+    for line in lines:
+        if line.startswith(('+', '*')):
+            operators = line
+        else:
+            columns.add_row(line)
+    for operator, start, stop in get_problems(operators, len(columns)):
+        numbers = columns[start:stop]
+        if operator == '+':
+            result += sum(numbers)
+        else:
+            result += math.prod(numbers)
     return result
 
 
-def get_problems(lines):
+def get_problems(operators, width):
     """
     The problems are written vertically not horizontally.
     The last line contains operators and their position indicates where to split the data vertically.
+    Yield each problem's operator and the range of columns it covers, leaving out the blank separator column.
     """
-    operators = lines[-1]
-    column_dividers = [i for i, o in enumerate(operators) if o != ' '] + [len(lines[0]) + 1]
+    column_dividers = [i for i, o in enumerate(operators) if o != ' '] + [width + 1]
     for i in range(len(column_dividers) - 1):
         i1, i2 = column_dividers[i], column_dividers[i+1] - 1
-        yield [line[i1:i2] for line in lines]
-
-
-def extract_numbers(problem):
-    """
-    Read each column of data in the problem and convert it to an integer.
-    """
-    numbers = problem[:-1]
-    columns = Columns()
-    for row in numbers:
-        columns.add_row(row)
-    result = []
-    for col in range(len(columns)):
-        result.append(int(''.join(columns[col])))
-    return result
+        yield operators[i1], i1, i2
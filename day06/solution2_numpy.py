@@ -0,0 +1,57 @@
+import numpy as np
+
+input_mode = 'mmap'
+
+# Any number with at most this many digits fits in an int64.
+INT64_DIGITS = 18
+
+
+def run(data):
+    """
+    Load the worksheet once as a character grid, read every vertical number at once,
+    then split the columns into problems at the operator positions on the last row.
+    Numbers and per-problem results are int64 as long as no problem has more than 18 digits in total,
+    which bounds both its sum and its product. Taller or wider worksheets fall back to Python ints
+    (object arrays), which are slower but can't overflow. The grand total is always summed as Python ints.
+    """
+    grid = get_grid(data)
+    operators = grid[-1]
+    problem_starts = np.flatnonzero(operators != ord(' '))
+    digit_counts = (grid[:-1] != ord(' ')).sum(axis=0)
+    fits = np.add.reduceat(digit_counts, problem_starts).max() <= INT64_DIGITS
+    values = extract_numbers(grid[:-1], np.int64 if fits else object)
+    has_digits = digit_counts > 0
+    is_sum = operators[problem_starts] == ord('+')
+    sums = np.add.reduceat(np.where(has_digits, values, 0), problem_starts)
+    products = np.multiply.reduceat(np.where(has_digits, values, 1), problem_starts)
+    return sum(np.where(is_sum, sums, products).tolist())
+
+
+def get_grid(data):
+    """
+    Convert the input (raw bytes, e.g. an mmap) into a 2D uint8 array of characters,
+    padding any short lines with spaces.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if len(buf) and buf[-1] != ord('\n'):
+        buf = np.append(buf, np.uint8(ord('\n')))
+    newlines = np.flatnonzero(buf == ord('\n'))
+    starts = np.concatenate(([0], newlines[:-1] + 1))
+    lengths = newlines - starts - (buf[np.maximum(newlines - 1, 0)] == ord('\r'))
+    cols = np.arange(lengths.max())
+    in_line = cols < lengths[:, None]
+    grid = np.full(in_line.shape, ord(' '), dtype=np.uint8)
+    grid[in_line] = buf[(starts[:, None] + cols)[in_line]]
+    return grid
+
+
+def extract_numbers(rows, dtype=np.int64):
+    """
+    Read the number in every column by applying Horner's rule down the rows (value * 10 + digit),
+    masked so blanks are skipped.
+    """
+    values = np.zeros(rows.shape[1], dtype=dtype)
+    for row in rows:
+        is_digit = row != ord(' ')
+        values = np.where(is_digit, values * 10 + (row.astype(np.int64) - ord('0')).astype(dtype), values)
+    return values
@@ -0,0 +1,37 @@
+def sweep(lines):
+    """
+    Follow the beams down the manifold one row at a time, tracking how many timelines have a beam in each column.
+    When a splitter is hit, every timeline in its column carries on in both neighbouring columns.
+    Return how many splitters were hit and how many timelines make it to the bottom.
+
+    Only the beam counts for the current row are kept, so memory is O(columns) however tall the manifold is.
+    Columns are padded by one on each side so beams split off the edge are simply lost.
+    """
+    lines = iter(lines)
+    counts = None
+    for line in lines:
+        start = line.find('S')
+        if start != -1:
+            counts = [0] * (len(line) + 2)
+            counts[start + 1] = 1
+            break
+    if counts is None:
+        return 0, 0
+
+    splitters_hit = 0
+    for line in lines:
+        col, splits = line.find('^'), []
+        while col != -1:
+            if counts[col + 1]:
+                splits.append(col + 1)
+            col = line.find('^', col + 1)
+        if splits:
+            splitters_hit += len(splits)
+            next_counts = list(counts)
+            for col in splits:
+                timelines = counts[col]
+                next_counts[col] -= timelines
+                next_counts[col - 1] += timelines
+                next_counts[col + 1] += timelines
+            counts = next_counts
+    return splitters_hit, sum(counts[1:-1])
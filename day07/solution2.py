@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import defaultdict, deque
 
+from day07.beams import sweep
+
+input_mode = 'stream'
+
 
 class Node:
 
@@ -38,12 +43,21 @@ class Node:
         The number of ways into a node is equal to the sum of the number of ways into its parents.
         Cache the result so we don't recalculate it. 
         A node with no parents has no entry points.
+        Parents are resolved with an explicit stack rather than recursion, so a node is only
+        counted once all its parents have been (a topological order), however deep the graph is.
         """
-        if self._entry_point_count is None:
-            if self._parents:
-                self._entry_point_count = sum(p.count_entry_points() for p in self._parents)
+        stack = [self]
+        while stack:
+            node = stack[-1]
+            if node._entry_point_count is not None:
+                stack.pop()
+                continue
+            pending = [p for p in node._parents if p._entry_point_count is None]
+            if pending:
+                stack.extend(pending)
             else:
-                self._entry_point_count = 0
+                node._entry_point_count = sum(p._entry_point_count for p in node._parents)
+                stack.pop()
         return self._entry_point_count
 
     def initialize_entry_points(self, value):
@@ -55,10 +69,18 @@ class Node:
 
 
 def run(lines):
+    _, timelines = sweep(lines)
+    return timelines
+
+
+def count_timelines(lines):
+    """
+    Count the timelines using the splitter graph instead of the row sweep.
+    Much slower, but the graph is handy for analysing the manifold.
+    """
     starting_node, nodes, max_row = build_graph(lines)
     starting_node.initialize_entry_points(1)
-    result = sum(n.count_entry_points() for n in nodes if n.row == max_row)
-    return result
+    return sum(n.count_entry_points() for n in nodes if n.row == max_row)
 
 
 def build_graph(lines):
@@ -70,15 +92,14 @@ def build_graph(lines):
     """
     start_position, splitters, max_row, max_col = parse_input(lines)
     nodes = [Node(*splitter) for splitter in splitters] + [Node(max_row, col) for col in range(max_col + 1)]
+    index = build_column_index(nodes)
     for node in nodes:
-        left_child, right_child = find_child(nodes, node, 'left'), find_child(nodes, node, 'right')
+        left_child, right_child = find_child(index, node, 'left'), find_child(index, node, 'right')
         if left_child:
             node.add_child(left_child)
         if right_child:
             node.add_child(right_child)
-    candidates = [n for n in nodes if n.row > start_position[0] and n.col == start_position[1]]
-    candidates.sort(key=lambda x: x.row)
-    return candidates[0], nodes, max_row
+    return find_node_below(index, *start_position), nodes, max_row
 
 
 def parse_input(lines):
@@ -98,15 +119,39 @@ def parse_input(lines):
     return start_position, splitters, max_row, max_col
 
 
-def find_child(nodes: list[Node], node: Node, direction):
+def build_column_index(nodes: list[Node]):
+    """
+    Group the nodes by column, sorted by row, so the node below any point can be found with a bisect.
+    Each column maps to a (rows, nodes) pair of parallel lists.
+    """
+    columns = defaultdict(list)
+    for node in nodes:
+        columns[node.col].append(node)
+    result = {}
+    for col, column in columns.items():
+        column.sort(key=lambda x: x.row)
+        result[col] = ([n.row for n in column], column)
+    return result
+
+
+def find_child(index, node: Node, direction):
     """
     For the provided node, find the closest node below it in the column
     to its left or right.
     """
     col = node.col + (1 if direction == 'right' else -1)
-    nodes = [n for n in nodes if n.col == col and n.row > node.row]
-    nodes.sort(key=lambda x: x.row)
-    return nodes[0] if nodes else None
+    return find_node_below(index, node.row, col)
+
+
+def find_node_below(index, row, col):
+    """
+    Find the closest node in column `col` that is strictly below `row`.
+    """
+    if col not in index:
+        return None
+    rows, nodes = index[col]
+    i = bisect_right(rows, row)
+    return nodes[i] if i < len(nodes) else None
 
 
 def count_exits(node: Node):
@@ -0,0 +1,176 @@
+import heapq
+import math
+from collections import defaultdict
+from itertools import product
+
+
+class Grid:
+
+    """
+    A 3D grid of junction boxes for radius queries.
+    Cells are sized per axis so that each holds about `per_cell` boxes on average, and an axis too thin to be
+    worth splitting (a flat or collinear layout, say) is left as a single layer of cells.
+    """
+
+    def __init__(self, junction_boxes, per_cell=2):
+        self._boxes = junction_boxes
+        self._lows = [min(c) for c in zip(*junction_boxes)]
+        highs = [max(c) for c in zip(*junction_boxes)]
+        extents = [h - l + 1 for l, h in zip(self._lows, highs)]
+        self._cell_sizes = get_cell_sizes(extents, len(junction_boxes) / per_cell)
+        self._last_cells = [(e - 1) // s for e, s in zip(extents, self._cell_sizes)]
+        self._diagonal_squared = sum((h - l) ** 2 for l, h in zip(self._lows, highs))
+        self._cells = defaultdict(list)
+        for i, jb in enumerate(junction_boxes):
+            self._cells[self._cell_of(jb)].append(i)
+
+    @property
+    def diagonal_squared(self):
+        return self._diagonal_squared
+
+    def _cell_of(self, jb):
+        return tuple((c - l) // s for c, l, s in zip(jb, self._lows, self._cell_sizes))
+
+    def within(self, i, radius_squared):
+        """
+        Return (distance squared, index) for every other box no further than sqrt(radius_squared) from box i.
+        Only the cells overlapping the cube around that sphere are visited, or just the occupied cells if there are fewer of those.
+        """
+        jb, radius = self._boxes[i], math.isqrt(radius_squared) + 1
+        x, y, z = jb
+        boxes, cells = self._boxes, self._cells
+        ranges = [range(max(0, (c - l - radius) // s), min(last, (c - l + radius) // s) + 1)
+                  for c, l, s, last in zip(jb, self._lows, self._cell_sizes, self._last_cells)]
+        if math.prod(len(r) for r in ranges) <= len(cells):
+            members = (cells.get(cell, ()) for cell in product(*ranges))
+        else:
+            members = cells.values()
+        result = []
+        for member in members:
+            for j in member:
+                other = boxes[j]
+                distance_squared = (x - other[0]) ** 2 + (y - other[1]) ** 2 + (z - other[2]) ** 2
+                if distance_squared <= radius_squared and j != i:
+                    result.append((distance_squared, j))
+        return result
+
+    def nearest(self, i, k):
+        """
+        Find the k nearest boxes to box i (fewer if there aren't k others).
+        Return the squared distance to the furthest of them, along with every box found no further away than that.
+        """
+        radius_squared = max(1, max(self._cell_sizes) ** 2 // 4)
+        while True:
+            found = self.within(i, radius_squared)
+            if len(found) >= k or radius_squared >= self._diagonal_squared:
+                break
+            radius_squared *= 4
+        return get_nearest(found, k)
+
+    def nearest_all(self, k):
+        """
+        Like nearest, for every box, yielding (index, kth distance squared, boxes found).
+        Boxes are handled a cell at a time against the 3x3x3 block of cells around them, gathered once per cell.
+        That answer is only trusted if the kth neighbour is closer than anything outside the block could be
+        (nothing lies beyond the outermost cells); otherwise fall back to a proper search.
+        """
+        boxes = self._boxes
+        for cell, members in self._cells.items():
+            block = []
+            for offset in product((-1, 0, 1), repeat=3):
+                block.extend((*boxes[j], j) for j in self._cells.get(tuple(c + o for c, o in zip(cell, offset)), ()))
+            for i in members:
+                x, y, z = jb = boxes[i]
+                found = [((x - bx) ** 2 + (y - by) ** 2 + (z - bz) ** 2, j) for bx, by, bz, j in block if j != i]
+                margin = min(get_margin(c - l, n, s, last)
+                             for c, n, l, s, last in zip(jb, cell, self._lows, self._cell_sizes, self._last_cells))
+                kth, found = get_nearest(found, k)
+                if len(found) < k or kth >= margin * margin:
+                    kth, found = self.nearest(i, k)
+                yield i, kth, found
+
+
+def get_cell_sizes(extents, cell_count):
+    """
+    Pick a cell size for each axis so the grid has about `cell_count` roughly cubic cells.
+    Working up from the shortest axis, any axis no longer than the cube side would be gets a single cell,
+    and the remaining axes share the cells out between them.
+    """
+    sizes = list(extents)
+    axes = sorted(range(len(extents)), key=lambda a: extents[a])
+    for position, axis in enumerate(axes):
+        remaining = axes[position:]
+        side = (math.prod(extents[a] for a in remaining) / max(1, cell_count)) ** (1 / len(remaining))
+        if side < extents[axis]:
+            for a in remaining:
+                sizes[a] = max(1, math.ceil(side))
+            break
+    return sizes
+
+
+def get_margin(offset, cell, size, last):
+    """
+    How far a box at `offset` along an axis is from the nearest point outside the 3 cells around its own `cell`.
+    There's nothing at all beyond the first and last cells.
+    """
+    below = offset - (cell - 1) * size + 1 if cell > 1 else math.inf
+    above = (cell + 2) * size - offset if cell < last - 1 else math.inf
+    return min(below, above)
+
+
+def get_nearest(found, k):
+    if not found:
+        return 0, []
+    kth = heapq.nsmallest(k, found)[-1][0]
+    return kth, [f for f in found if f[0] <= kth]
+
+
+def iterate_closest_pairs(junction_boxes, k=4):
+    """
+    Yield pairs of junction boxes in order by increasing distance between them (ties broken by the boxes themselves),
+    without ever building the full list of pairs.
+
+    Each pair belongs to its smaller box. Every box starts with just the pairs out to its kth nearest neighbour,
+    and the heap holds each box's next unused pair. Once a box runs out, the heap holds a marker at the radius it
+    has searched so far instead, since none of its remaining pairs can be any closer than that. When the marker
+    comes off the heap the box searches twice as far. Memory stays around O(n * k) rather than O(n^2).
+    """
+    if len(junction_boxes) < 2:
+        return
+    grid = Grid(junction_boxes)
+    radii, candidates, heap = [0] * len(junction_boxes), [None] * len(junction_boxes), []
+    for i, radius_squared, found in grid.nearest_all(k):
+        jb = junction_boxes[i]
+        radii[i] = radius_squared
+        candidates[i] = sorted(((d, junction_boxes[j]) for d, j in found if junction_boxes[j] > jb), reverse=True)
+        push_next(heap, junction_boxes, candidates, radii, i)
+    while heap:
+        entry = heapq.heappop(heap)
+        i = entry[-1]
+        if entry[1] == 0:
+            yield entry[2], entry[3]
+        else:
+            radius_squared = radii[i]
+            radii[i] = max(1, radius_squared * 4)
+            candidates[i] = get_candidates(grid, junction_boxes, i, radius_squared, radii[i])
+        if candidates[i] or radii[i] < grid.diagonal_squared:
+            push_next(heap, junction_boxes, candidates, radii, i)
+
+
+def get_candidates(grid, junction_boxes, i, low, high):
+    """
+    The pairs belonging to box i that are further than sqrt(low) but no further than sqrt(high), nearest last.
+    """
+    jb = junction_boxes[i]
+    result = [(d, junction_boxes[j]) for d, j in grid.within(i, high) if d > low and junction_boxes[j] > jb]
+    result.sort(reverse=True)
+    return result
+
+
+def push_next(heap, junction_boxes, candidates, radii, i):
+    if candidates[i]:
+        distance_squared, jb = candidates[i].pop()
+        heapq.heappush(heap, (distance_squared, 0, junction_boxes[i], jb, i))
+    else:
+        heapq.heappush(heap, (radii[i], 1, i))
+
@@ -0,0 +1,52 @@
+from array import array
+
+
+class DisjointSet:
+
+    """
+    Union-find over the integers 0..n-1, with path compression and union by size.
+    Parents and sizes live in flat typed arrays, and the number of components and the size of the largest
+    are kept up to date on every union, so none of them ever need recounting.
+    """
+
+    def __init__(self, n):
+        self._parent = array('q', range(n))
+        self._size = array('q', [1]) * n
+        self._count = n
+        self._largest = 1 if n else 0
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def largest(self):
+        return self._largest
+
+    def find(self, x):
+        parent = self._parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b):
+        """
+        Merge the components containing `a` and `b`. Return False if they were already the same component.
+        """
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self._size[a] < self._size[b]:
+            a, b = b, a
+        self._parent[b] = a
+        self._size[a] += self._size[b]
+        self._count -= 1
+        self._largest = max(self._largest, self._size[a])
+        return True
+
+    def size(self, x):
+        return self._size[self.find(x)]
+
+    def component_sizes(self):
+        return [self._size[x] for x in range(len(self._parent)) if self._parent[x] == x]
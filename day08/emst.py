@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+
+from day08.disjoint_set import DisjointSet
+
+
+def minimum_spanning_tree(junction_boxes):
+    """
+    Build the Euclidean minimum spanning tree of the junction boxes with dense Prim's algorithm.
+    Return its edges as (distance squared, jb1, jb2) in the order they were added.
+
+    Every box not yet in the tree keeps its distance to the nearest box that is. Adding a box means one
+    vectorized pass over those distances, so the run is O(n^2) time but only O(n) memory.
+    Boxes are removed from the working arrays by swapping in the last one, so each pass only covers the boxes left.
+    """
+    points = np.array(junction_boxes, dtype=np.int64)
+    n = len(points)
+    if n < 2:
+        return []
+    xs, ys, zs = (points[1:, c].copy() for c in range(3))
+    remaining = np.arange(1, n)
+    best = (xs - points[0, 0]) ** 2 + (ys - points[0, 1]) ** 2 + (zs - points[0, 2]) ** 2
+    best_from = np.zeros(n - 1, dtype=np.int64)
+    result, size = [], n - 1
+    while size:
+        k = int(best[:size].argmin())
+        v = int(remaining[k])
+        result.append((int(best[k]), junction_boxes[int(best_from[k])], junction_boxes[v]))
+        size -= 1
+        for values in (xs, ys, zs, remaining, best, best_from):
+            values[k] = values[size]
+        x, y, z = points[v]
+        distances = (xs[:size] - x) ** 2 + (ys[:size] - y) ** 2 + (zs[:size] - z) ** 2
+        closer = distances < best[:size]
+        best[:size][closer] = distances[closer]
+        best_from[:size][closer] = v
+    return result
+
+
+def get_last_connection(junction_boxes):
+    """
+    Return the pair of junction boxes that connecting the closest pairs in order would join last.
+    That is always an edge of the longest length in the minimum spanning tree. When several pairs share
+    that length, which one joins last depends on the order they're processed in, so redo just that step:
+    build the circuits from the shorter tree edges, then connect every pair of exactly that length in order.
+    """
+    edges = minimum_spanning_tree(junction_boxes)
+    longest = max(d for d, _, _ in edges)
+    index = {jb: i for i, jb in enumerate(junction_boxes)}
+    circuits = DisjointSet(len(junction_boxes))
+    for d, jb1, jb2 in edges:
+        if d < longest:
+            circuits.union(index[jb1], index[jb2])
+    for jb1, jb2 in sorted(get_pairs_at_distance(junction_boxes, longest)):
+        circuits.union(index[jb1], index[jb2])
+        if circuits.count == 1:
+            return jb1, jb2
+
+
+def get_pairs_at_distance(junction_boxes, distance_squared):
+    """
+    Find every pair of junction boxes exactly sqrt(distance_squared) apart, as (jb1, jb2) with jb1 < jb2.
+    With the boxes sorted by x, each box only needs comparing with the run of later boxes whose x is within reach.
+    """
+    points = np.array(sorted(junction_boxes), dtype=np.int64)
+    xs, ys, zs = (points[:, c].copy() for c in range(3))
+    stops = np.searchsorted(xs, xs + math.isqrt(distance_squared), side='right')
+    result = []
+    for i in range(len(points)):
+        start, stop = i + 1, int(stops[i])
+        if start < stop:
+            distances = (xs[start:stop] - xs[i]) ** 2 + (ys[start:stop] - ys[i]) ** 2 + (zs[start:stop] - zs[i]) ** 2
+            for j in np.flatnonzero(distances == distance_squared):
+                result.append((tuple(points[i].tolist()), tuple(points[start + j].tolist())))
+    return result
@@ -0,0 +1,57 @@
+import numpy as np
+
+# Once the boxes are shifted to start at zero, a span below this on every axis keeps every intermediate
+# of the distance calculation (at most 6 * span^2) exact in float64, i.e. below 2^53.
+EXACT_SPAN_LIMIT = 2 ** 25
+
+
+def k_closest_pairs(junction_boxes, k, block_elements=1 << 21):
+    """
+    Return the k closest pairs of junction boxes as (distance squared, jb1, jb2) with jb1 < jb2,
+    in the same order as sorting every pair by (distance squared, jb1, jb2).
+
+    Boxes are sorted first so that index order matches tuple order. Squared distances are then computed a
+    block of rows at a time against every later box, as |a|^2 + |b|^2 - 2 a.b so the bulk of the work is a
+    single matrix product. The boxes are shifted so each axis starts at zero first, which keeps those terms
+    small enough to be exact in float64. Each block only keeps what could still make the cut: anything no
+    further than the current kth best, trimmed to its k smallest (plus ties) with a partial sort.
+    Memory stays around block_elements + k.
+    """
+    points = np.array(sorted(junction_boxes), dtype=np.int64)
+    n = len(points)
+    if n < 2 or k <= 0:
+        return []
+    lows = points.min(axis=0)
+    if int((points.max(axis=0) - lows).max()) >= EXACT_SPAN_LIMIT:
+        raise ValueError(f'Coordinates must span less than {EXACT_SPAN_LIMIT} on every axis for exact distances')
+    as_float = (points - lows).astype(np.float64)
+    norms = (as_float * as_float).sum(axis=1)
+    block_rows = max(1, block_elements // n)
+    best_d, best_i, best_j = np.empty(0), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    threshold = np.finfo(np.float64).max
+    for start in range(0, n - 1, block_rows):
+        stop = min(start + block_rows, n - 1)
+        distances = as_float[start:stop] @ as_float[start + 1:].T
+        distances *= -2
+        distances += norms[start:stop, None]
+        distances += norms[None, start + 1:]
+        # Only pairs with the column box after the row box count; those before are all in the leading square.
+        square = distances[:, :stop - start]
+        square[np.tril_indices(stop - start, -1)] = np.inf
+        flat = distances.ravel()
+        keep = np.flatnonzero(flat <= threshold)
+        if len(keep) > k:
+            keep = keep[flat[keep] <= np.partition(flat[keep], k - 1)[k - 1]]
+        rows, cols = np.divmod(keep, distances.shape[1])
+        best_d = np.concatenate((best_d, flat[keep]))
+        best_i = np.concatenate((best_i, rows + start))
+        best_j = np.concatenate((best_j, cols + start + 1))
+        if len(best_d) >= k:
+            threshold = np.partition(best_d, k - 1)[k - 1]
+            keep = np.flatnonzero(best_d <= threshold)
+            best_d, best_i, best_j = best_d[keep], best_i[keep], best_j[keep]
+    order = np.lexsort((best_j, best_i, best_d))[:k]
+    result = []
+    for d, i, j in zip(best_d[order].astype(np.int64).tolist(), best_i[order].tolist(), best_j[order].tolist()):
+        result.append((d, tuple(points[i].tolist()), tuple(points[j].tolist())))
+    return result
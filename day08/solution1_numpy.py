@@ -0,0 +1,16 @@
+import heapq
+import math
+
+from day08.disjoint_set import DisjointSet
+from day08.pairwise import k_closest_pairs
+from day08.solution1 import CONNECTIONS, get_junction_boxes
+
+
+def run(lines):
+    junction_boxes = get_junction_boxes(lines)
+    index = {jb: i for i, jb in enumerate(junction_boxes)}
+    circuits = DisjointSet(len(junction_boxes))
+    for _, jb1, jb2 in k_closest_pairs(junction_boxes, CONNECTIONS):
+        circuits.union(index[jb1], index[jb2])
+    largest_lengths = heapq.nlargest(3, circuits.component_sizes())
+    return math.prod(largest_lengths)
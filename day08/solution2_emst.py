@@ -0,0 +1,8 @@
+from day08.emst import get_last_connection
+from day08.solution2 import get_junction_boxes
+
+
+def run(lines):
+    junction_boxes = get_junction_boxes(lines)
+    jb1, jb2 = get_last_connection(junction_boxes)
+    return jb1[0] * jb2[0]
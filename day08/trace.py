@@ -0,0 +1,76 @@
+import csv
+import heapq
+import math
+
+from day08.closest_pairs import iterate_closest_pairs
+from day08.disjoint_set import DisjointSet
+
+CSV_HEADER = ['step', 'x1', 'y1', 'z1', 'x2', 'y2', 'z2', 'distance', 'components', 'largest_component']
+
+
+def trace_connections(junction_boxes, budget=None, pairs=None, circuits=None):
+    """
+    Connect the closest pairs of junction boxes in order, and after each connection yield
+    (step, edge, distance, components, largest_component), where edge is the (jb1, jb2) pair just connected.
+
+    Stops after `budget` connections, or as soon as everything is a single circuit, since nothing changes after that.
+    `pairs` defaults to the closest pair stream. Pass in `circuits` (a DisjointSet over the boxes' indexes)
+    to look at more than the event carries between steps, e.g. all of the circuit sizes.
+    """
+    index = {jb: i for i, jb in enumerate(junction_boxes)}
+    if circuits is None:
+        circuits = DisjointSet(len(junction_boxes))
+    if pairs is None:
+        pairs = iterate_closest_pairs(junction_boxes)
+    if circuits.count <= 1 or budget == 0:
+        return
+    for step, (jb1, jb2) in enumerate(pairs, start=1):
+        circuits.union(index[jb1], index[jb2])
+        yield step, (jb1, jb2), math.dist(jb1, jb2), circuits.count, circuits.largest
+        if step == budget or circuits.count == 1:
+            return
+
+
+def write_csv(events, path, every=1):
+    """
+    Pass the events straight through, writing every `every`th one to a CSV file at `path` as they go by.
+    The last event is always written, so the file ends with the final state.
+    """
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_HEADER)
+        last, written = None, None
+        for event in events:
+            if event[0] % every == 0:
+                writer.writerow(to_row(event))
+                written = event
+            last = event
+            yield event
+        if last is not written:
+            writer.writerow(to_row(last))
+
+
+def to_row(event):
+    step, (jb1, jb2), distance, components, largest_component = event
+    return [step, *jb1, *jb2, distance, components, largest_component]
+
+
+def connect_all(junction_boxes, budget=1000, csv_path=None, every=1):
+    """
+    Answer both parts in one pass: the product of the three largest circuit sizes after `budget` connections,
+    and the product of the x coordinates of the last pair needed to join everything into one circuit.
+    Optionally sample the trace to `csv_path` along the way.
+    """
+    circuits = DisjointSet(len(junction_boxes))
+    events = trace_connections(junction_boxes, circuits=circuits)
+    if csv_path:
+        events = write_csv(events, csv_path, every)
+    part1, part2 = None, None
+    for step, (jb1, jb2), _, components, _ in events:
+        if step == budget:
+            part1 = math.prod(heapq.nlargest(3, circuits.component_sizes()))
+        if components == 1:
+            part2 = jb1[0] * jb2[0]
+    if part1 is None:
+        part1 = math.prod(heapq.nlargest(3, circuits.component_sizes()))
+    return part1, part2
@@ -0,0 +1,76 @@
+import numpy as np
+
+
+class CompressedGrid:
+
+    """
+    The polygon's tiles squeezed onto the distinct x and y coordinates of its corners.
+    Cell 2k covers exactly coordinate k, and cell 2k + 1 covers the open gap between coordinates k and k + 1,
+    so every cell is either entirely inside (or on) the polygon or entirely outside it.
+    A 2D prefix sum over the outside cells makes the "is this rectangle fully inside" test O(1).
+    """
+
+    def __init__(self, corners):
+        self._xs = sorted({x for x, _ in corners})
+        self._ys = sorted({y for _, y in corners})
+        self._x_index = {x: i for i, x in enumerate(self._xs)}
+        self._y_index = {y: i for i, y in enumerate(self._ys)}
+        outside = ~self._rasterize(corners)
+        self._prefix = np.zeros((outside.shape[0] + 1, outside.shape[1] + 1), dtype=np.int64)
+        self._prefix[1:, 1:] = outside.cumsum(axis=0).cumsum(axis=1)
+
+    def _rasterize(self, corners):
+        """
+        Return a boolean array over the compressed cells that is True for every cell inside or on the polygon.
+
+        The edges are painted on directly. Every gap cell (odd, odd) is inside when an odd number of vertical
+        edges cross its row to its left. Any other cell that isn't on an edge shares its status with the gap
+        cell diagonally up and to the left of it, since nothing separates the two. The gaps are padded with an
+        outside border so cells along the top and left edges have something to look at.
+        """
+        width, height = len(self._xs), len(self._ys)
+        boundary = np.zeros((2 * height - 1, 2 * width - 1), dtype=bool)
+        crossings = np.zeros((height + 1, width), dtype=np.int8)
+        for (x1, y1), (x2, y2) in zip(corners, corners[1:] + corners[:1]):
+            c1, c2 = sorted((self._x_index[x1], self._x_index[x2]))
+            r1, r2 = sorted((self._y_index[y1], self._y_index[y2]))
+            boundary[2 * r1:2 * r2 + 1, 2 * c1:2 * c2 + 1] = True
+            if c1 == c2:
+                crossings[r1 + 1:r2 + 1, c1] ^= 1
+        gaps = np.zeros((height + 1, width + 1), dtype=bool)
+        gaps[:, 1:] = crossings.cumsum(axis=1) % 2 == 1
+        rows = (np.arange(2 * height - 1) + 1) // 2
+        cols = (np.arange(2 * width - 1) + 1) // 2
+        return boundary | gaps[rows[:, None], cols[None, :]]
+
+    def is_inside(self, p1, p2):
+        """
+        Determine if every tile of the rectangle with opposite corners p1 and p2 (both polygon corners) is inside the polygon.
+        """
+        c1, c2 = sorted((self._x_index[p1[0]], self._x_index[p2[0]]))
+        r1, r2 = sorted((self._y_index[p1[1]], self._y_index[p2[1]]))
+        return self.count_outside(2 * r1, 2 * c1, 2 * r2 + 1, 2 * c2 + 1) == 0
+
+    def count_outside(self, row_start, col_start, row_stop, col_stop):
+        prefix = self._prefix
+        return int(prefix[row_stop, col_stop] - prefix[row_start, col_stop] - prefix[row_stop, col_start] + prefix[row_start, col_start])
+
+    def largest_inside_rectangle(self, corners):
+        """
+        Find the largest area of a rectangle with two of the corners as opposite corners that is fully inside the polygon.
+        Each corner is checked against all the later ones at once, using the same prefix sum lookup as is_inside.
+        """
+        xs = np.array([x for x, _ in corners], dtype=np.int64)
+        ys = np.array([y for _, y in corners], dtype=np.int64)
+        cols = np.array([2 * self._x_index[x] for x, _ in corners])
+        rows = np.array([2 * self._y_index[y] for _, y in corners])
+        prefix, result = self._prefix, 0
+        for i in range(len(corners) - 1):
+            c1, c2 = np.minimum(cols[i], cols[i + 1:]), np.maximum(cols[i], cols[i + 1:]) + 1
+            r1, r2 = np.minimum(rows[i], rows[i + 1:]), np.maximum(rows[i], rows[i + 1:]) + 1
+            outside = prefix[r2, c2] - prefix[r1, c2] - prefix[r2, c1] + prefix[r1, c1]
+            areas = (np.abs(xs[i + 1:] - xs[i]) + 1) * (np.abs(ys[i + 1:] - ys[i]) + 1)
+            areas = areas[outside == 0]
+            if len(areas):
+                result = max(result, int(areas.max()))
+        return result
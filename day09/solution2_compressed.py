@@ -0,0 +1,18 @@
+from day09.compressed import CompressedGrid
+
+
+def run(lines):
+    corners = get_corners(lines)
+    grid = CompressedGrid(corners)
+    return grid.largest_inside_rectangle(corners)
+
+
+def get_corners(lines):
+    """
+    Read the red tiles as (x, y) tuples, keeping them in order since consecutive tiles make up the polygon's edges.
+    """
+    result = []
+    for line in lines:
+        if line:
+            result.append(tuple([int(x) for x in line.split(",")]))
+    return result
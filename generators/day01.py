@@ -0,0 +1,9 @@
+import random
+
+
+def generate(size, seed=None, max_clicks=999):
+    """
+    Generate `size` dial rotations of between 1 and `max_clicks` clicks each.
+    """
+    rng = random.Random(seed)
+    return [f'{rng.choice("LR")}{rng.randint(1, max_clicks)}' for _ in range(size)]
@@ -0,0 +1,39 @@
+import bisect
+import random
+
+
+def generate(size, seed=None, max_digits=10, max_width=1_000_000):
+    """
+    Generate a single line of `size` disjoint ID ranges.
+    Each range starts at a random value of up to `max_digits` digits and spans at most `max_width` IDs.
+    Ranges that would overlap or touch one already drawn are redrawn, giving up (with a ValueError) once
+    there are so many draws that the ranges clearly won't fit.
+    """
+    rng = random.Random(seed)
+    starts, ends = [], []
+    for _ in range(100 * size):
+        if len(starts) == size:
+            break
+        digits = rng.randint(1, max_digits)
+        start = rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        end = start + rng.randint(0, max_width)
+        i = bisect.bisect_left(starts, start)
+        if i > 0 and ends[i - 1] + 1 >= start:
+            continue
+        if i < len(starts) and end + 1 >= starts[i]:
+            continue
+        starts.insert(i, start)
+        ends.insert(i, end)
+    if len(starts) < size:
+        raise ValueError(f'Could only fit {len(starts)} of {size} disjoint ranges; '
+                         f'try a larger max_digits or smaller max_width')
+    ranges = list(zip(starts, ends))
+    rng.shuffle(ranges)
+    return [','.join(f'{start}-{end}' for start, end in ranges)]
+
+
+def size_of(lines):
+    """
+    The ranges are all on one line.
+    """
+    return sum(line.count(',') + 1 for line in lines if line)
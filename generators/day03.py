@@ -0,0 +1,9 @@
+import random
+
+
+def generate(size, seed=None, width=100):
+    """
+    Generate `size` battery banks, each a line of `width` digits from 1 to 9.
+    """
+    rng = random.Random(seed)
+    return [''.join(rng.choices('123456789', k=width)) for _ in range(size)]
@@ -0,0 +1,18 @@
+import random
+
+
+def generate(size, seed=None, height=None, density=0.65):
+    """
+    Generate a `size` wide by `height` tall grid (square by default) where each cell
+    holds a paper roll with probability `density`.
+    """
+    rng = random.Random(seed)
+    height = size if height is None else height
+    return [''.join('@' if rng.random() < density else '.' for _ in range(size)) for _ in range(height)]
+
+
+def size_of(lines):
+    """
+    The number of cells in the grid.
+    """
+    return sum(len(line) for line in lines)
@@ -0,0 +1,18 @@
+import random
+
+
+def generate(size, seed=None, ingredients=None, max_value=10 ** 15, max_width=10 ** 12):
+    """
+    Generate `size` fresh ingredient ranges (which may overlap), a blank line,
+    then `ingredients` ingredient IDs (`size` by default).
+    """
+    rng = random.Random(seed)
+    ingredients = size if ingredients is None else ingredients
+    result = []
+    for _ in range(size):
+        start = rng.randint(1, max_value)
+        result.append(f'{start}-{start + rng.randint(0, max_width)}')
+    result.append('')
+    for _ in range(ingredients):
+        result.append(str(rng.randint(1, max_value + max_width)))
+    return result
@@ -0,0 +1,28 @@
+import random
+
+
+def generate(size, seed=None, rows=4, max_digits=4):
+    """
+    Generate a worksheet of `size` problems, each with `rows` numbers stacked vertically.
+    Within a problem the numbers are either all left aligned or all right aligned, and they
+    never get shorter going down, so reading a column top to bottom never hits a gap between digits.
+    Problems are separated by a column of spaces.
+    """
+    rng = random.Random(seed)
+    lines, operators = [[] for _ in range(rows)], []
+    for _ in range(size):
+        numbers = [str(rng.randint(1, 10 ** rng.randint(1, max_digits) - 1)) for _ in range(rows)]
+        numbers.sort(key=len)
+        width = max(len(n) for n in numbers)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for line, number in zip(lines, numbers):
+            line.append(align(number, width))
+        operators.append(rng.choice('+*').ljust(width))
+    return [' '.join(line) for line in lines] + [' '.join(operators)]
+
+
+def size_of(lines):
+    """
+    The number of numbers on the worksheet: one per problem on each row above the operators.
+    """
+    return len(lines[-1].split()) * (len(lines) - 1) if lines else 0
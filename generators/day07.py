@@ -0,0 +1,29 @@
+import random
+
+
+def generate(size, seed=None, width=None, density=0.5):
+    """
+    Generate a manifold `size` rows tall and `width` columns wide (square by default).
+    The start is centred on the top row and splitters sit on every other row in a checkerboard
+    pattern, so no two splitters are ever adjacent and none touch the edges. Like the puzzle input,
+    the last row never has splitters.
+    """
+    rng = random.Random(seed)
+    width = size if width is None else width
+    start_col = width // 2
+    result = ['.' * start_col + 'S' + '.' * (width - start_col - 1)]
+    for row in range(1, size):
+        cells = ['.'] * width
+        if row % 2 == 0 and row < size - 1:
+            for col in range(1, width - 1):
+                if (col - start_col + row // 2) % 2 == 1 and rng.random() < density:
+                    cells[col] = '^'
+        result.append(''.join(cells))
+    return result
+
+
+def size_of(lines):
+    """
+    The number of cells in the manifold.
+    """
+    return sum(len(line) for line in lines)
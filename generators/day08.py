@@ -0,0 +1,14 @@
+import random
+
+
+def generate(size, seed=None, max_coordinate=100_000):
+    """
+    Generate `size` distinct junction boxes with x, y and z between 0 and `max_coordinate`.
+    """
+    rng = random.Random(seed)
+    boxes = set()
+    while len(boxes) < size:
+        boxes.add(tuple(rng.randint(0, max_coordinate) for _ in range(3)))
+    boxes = list(boxes)
+    rng.shuffle(boxes)
+    return [','.join(str(c) for c in box) for box in boxes]
@@ -0,0 +1,34 @@
+import random
+
+
+def generate(size, seed=None, max_coordinate=100_000):
+    """
+    Generate the red tiles of a simple rectilinear polygon with roughly `size` corners.
+
+    The polygon is a run of vertical slabs. Slab i spans x_i..x_i+1 and y lo_i..hi_i,
+    and neighbouring slabs overlap vertically so the outline walks along the tops from left
+    to right and back along the bottoms. Every edge is at least two tiles away from any
+    parallel edge it doesn't share a corner with.
+    """
+    rng = random.Random(seed)
+    slabs = max(2, size // 4)
+    xs = sorted(rng.sample(range(0, max_coordinate + 1, 3), slabs + 1))
+    mid = max_coordinate // 2
+    his, los = [], []
+    for _ in range(slabs):
+        hi, lo = rng.randint(mid + 2, max_coordinate), rng.randint(0, mid - 2)
+        while his and hi == his[-1]:
+            hi = rng.randint(mid + 2, max_coordinate)
+        while los and lo == los[-1]:
+            lo = rng.randint(0, mid - 2)
+        his.append(hi)
+        los.append(lo)
+    points = [(xs[0], his[0])]
+    for i in range(1, slabs):
+        points.extend([(xs[i], his[i - 1]), (xs[i], his[i])])
+    points.append((xs[-1], his[-1]))
+    points.append((xs[-1], los[-1]))
+    for i in range(slabs - 1, 0, -1):
+        points.extend([(xs[i], los[i]), (xs[i], los[i - 1])])
+    points.append((xs[0], los[0]))
+    return [f'{x},{y}' for x, y in points]
@@ -0,0 +1,25 @@
+import random
+
+
+def generate(size, seed=None, min_lights=3, max_lights=10, max_presses=20):
+    """
+    Generate `size` machines. The indicator lights and joltage requirements are produced by
+    pressing random buttons, so every machine is guaranteed to be solvable.
+    """
+    rng = random.Random(seed)
+    result = []
+    for _ in range(size):
+        lights = rng.randint(min_lights, max_lights)
+        buttons = []
+        for _ in range(rng.randint(2, lights + 3)):
+            buttons.append(tuple(sorted(rng.sample(range(lights), rng.randint(1, lights)))))
+        state, joltage = [False] * lights, [0] * lights
+        for button in buttons:
+            presses = rng.randint(0, max_presses)
+            for i in button:
+                joltage[i] += presses
+                state[i] ^= presses % 2 == 1
+        diagram = ''.join('#' if s else '.' for s in state)
+        button_text = ' '.join(f'({",".join(str(i) for i in b)})' for b in buttons)
+        result.append(f'[{diagram}] {button_text} {{{",".join(str(j) for j in joltage)}}}')
+    return result
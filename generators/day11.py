@@ -0,0 +1,24 @@
+import itertools
+import random
+import string
+
+
+def generate(size, seed=None, max_outputs=3):
+    """
+    Generate a directed acyclic graph of `size` devices (at most 26^3 - 1) feeding into `out`.
+    The devices `you`, `svr`, `dac` and `fft` are always present.
+    Each device only connects to devices later in a random topological order.
+    """
+    rng = random.Random(seed)
+    special = ['svr', 'you', 'dac', 'fft']
+    names = [''.join(n) for n in itertools.product(string.ascii_lowercase, repeat=3)]
+    names = [n for n in names if n not in special and n != 'out']
+    devices = rng.sample(names, max(0, size - len(special))) + special[:size]
+    rng.shuffle(devices)
+    devices.append('out')
+    result = []
+    for i, device in enumerate(devices[:-1]):
+        later = devices[i + 1:]
+        outputs = rng.sample(later, min(len(later), rng.randint(1, max_outputs)))
+        result.append(f'{device}: {" ".join(outputs)}')
+    return result
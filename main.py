@@ -1,12 +1,45 @@
 import argparse
+import concurrent.futures
+import contextlib
+import cProfile
 import importlib
+import io
+import json
+import math
+import mmap
 import os
+import pstats
+import re
+import signal
+import statistics
+import sys
+import tempfile
 import time
+import tracemalloc
 
 argparser = argparse.ArgumentParser()
-argparser.add_argument('day', type=int)
-argparser.add_argument('solution', type=int)
-argparser.add_argument('input')
+argparser.add_argument('day', type=int, nargs='?')
+argparser.add_argument('solution', type=int, nargs='?')
+argparser.add_argument('input', nargs='?')
+argparser.add_argument('--engine', metavar='NAME', help='run an alternative implementation, dayNN/solutionM_NAME.py')
+argparser.add_argument('--compare', metavar='ENGINES', help='benchmark the default solution against each comma-separated engine')
+argparser.add_argument('--bench', type=int, metavar='N', help='run the solution N times and report timing statistics')
+argparser.add_argument('--json', metavar='PATH', help='write benchmark results to PATH as JSON')
+argparser.add_argument('--all', action='store_true', help='run every solution against every input in parallel')
+argparser.add_argument('--days', metavar='RANGE', help='like --all but limited to the given days, e.g. 1-9 or 1,3,5-7')
+argparser.add_argument('--timeout', type=float, metavar='SECONDS', help='per-job time limit for --all/--days')
+argparser.add_argument('--profile', action='store_true', help='profile the solution with cProfile')
+argparser.add_argument('--profile-out', metavar='PATH', help='dump raw cProfile stats to PATH (e.g. for snakeviz)')
+argparser.add_argument('--memory', action='store_true', help='trace memory allocations with tracemalloc')
+argparser.add_argument('--top', type=int, default=20, metavar='N', help='number of entries to show for --profile/--memory')
+argparser.add_argument('--generate', type=int, metavar='SIZE', help='write a synthetic input of the given size to the input file first')
+argparser.add_argument('--force', action='store_true', help='let --generate overwrite an existing input file')
+argparser.add_argument('--seed', type=int, help='random seed for --generate/--sweep')
+argparser.add_argument('--sweep', metavar='SIZES', help='time the solution on synthetic inputs of each size, e.g. 1000,2000,4000')
+
+solution_pattern = re.compile(r'solution([0-9]+)\.py')
+input_pattern = re.compile(r'input_(.+)\.txt')
+day_pattern = re.compile(r'day([0-9]{2})')
 
 
 def main():
@@ -18,33 +51,378 @@ def main():
 def init():
     global args
     args = argparser.parse_args()
+    if not (args.all or args.days) and args.solution is None:
+        argparser.error('day and solution are required unless --all or --days is given')
+    if not (args.all or args.days or args.sweep) and args.input is None:
+        argparser.error('input is required unless --all, --days or --sweep is given')
+    if args.generate and not args.force and os.path.exists(get_input_path(args.day, args.input)):
+        argparser.error(f'{get_input_path(args.day, args.input)} already exists; pass --force to overwrite it')
+    # Some answers (e.g. day07 timelines on tall manifolds) are far too long for the default int-to-str limit.
+    sys.set_int_max_str_digits(0)
     global start_time
-    start_time = time.time()
+    start_time = time.perf_counter()
 
 
 def process():
-    solution = get_solution(args.day, args.solution)
-    answer = solution.run(get_input_lines(args.day, args.input))
+    if args.all or args.days:
+        days = parse_days(args.days) if args.days else None
+        results = run_jobs(discover_jobs(days), args.timeout)
+        print_results(results)
+        return
+    if args.compare:
+        engines = [None] + args.compare.split(',')
+        results = [benchmark(get_solution(args.day, args.solution, e), args.day, args.input, args.bench or 1) for e in engines]
+        print_comparison(results)
+        if args.json:
+            with open(args.json, 'w') as file:
+                json.dump(results, file, indent=2)
+        return
+    solution = get_solution(args.day, args.solution, args.engine)
+    if args.sweep:
+        results = sweep(solution, args.day, [int(x) for x in args.sweep.split(',')], args.bench or 1, args.seed)
+        print_sweep(results)
+        if args.json:
+            with open(args.json, 'w') as file:
+                json.dump(results, file, indent=2)
+        return
+    if args.generate:
+        write_input(get_input_path(args.day, args.input), generate_input(args.day, args.generate, args.seed))
+    if args.bench:
+        results = benchmark(solution, args.day, args.input, args.bench)
+        print_benchmark(results)
+        if args.json:
+            with open(args.json, 'w') as file:
+                json.dump(results, file, indent=2)
+        return
+    lines = get_input(args.day, args.input, get_input_mode(solution))
+    answer = run_instrumented(solution, lines)
     print(f'Answer: {answer}')
 
 
-def get_solution(day, solution):
+def get_solution(day, solution, engine=None):
     module_name = f'day{day:02d}.solution{solution}'
+    if engine:
+        module_name += f'_{engine}'
     return importlib.import_module(module_name)
 
 
-def get_input_lines(day, input_id):
+def get_input_mode(solution):
+    """
+    Solutions declare how they want their input with a module-level `input_mode`:
+      'lines'  - a list of str lines (the default)
+      'stream' - a lazy iterator of str lines, for solutions that only need one pass
+      'mmap'   - a read-only mmap of the raw file bytes
+    """
+    return getattr(solution, 'input_mode', 'lines')
+
+
+def get_input(day, input_id, mode='lines'):
+    return load_input(get_input_path(day, input_id), mode)
+
+
+def load_input(file_path, mode='lines'):
+    if mode == 'lines':
+        with open(file_path) as file:
+            return file.read().splitlines()
+    elif mode == 'stream':
+        return stream_input_lines(file_path)
+    elif mode == 'mmap':
+        return map_input(file_path)
+    raise ValueError(f'Unknown input mode: {mode}')
+
+
+def get_input_path(day, input_id):
     file_name = f'input_{input_id}.txt'
-    file_path = os.path.join(f'day{day:02d}', file_name)
+    return os.path.join(f'day{day:02d}', file_name)
+
+
+def stream_input_lines(file_path):
     with open(file_path) as file:
-        return file.read().splitlines()
+        for line in file:
+            yield line.rstrip('\r\n')
+
+
+def map_input(file_path):
+    """
+    Map the file into memory without copying it. Empty files can't be mapped, so they come back as empty bytes.
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def run_instrumented(solution, lines):
+    """
+    Run the solution, wrapping just the `run` call with whichever profilers were requested.
+    """
+    profiler = cProfile.Profile() if args.profile or args.profile_out else None
+    if args.memory:
+        tracemalloc.start()
+    if profiler:
+        answer = profiler.runcall(solution.run, lines)
+    else:
+        answer = solution.run(lines)
+    if args.memory:
+        report_memory()
+        tracemalloc.stop()
+    if profiler:
+        report_profile(profiler)
+    return answer
+
+
+def report_memory():
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+    ))
+    print(f'Peak memory: {peak / 1024 / 1024:.3f} MiB')
+    print(f'Top {args.top} allocation sites still alive after run:')
+    for stat in snapshot.statistics('lineno')[:args.top]:
+        print(f'  {stat}')
+
+
+def report_profile(profiler):
+    if args.profile_out:
+        profiler.dump_stats(args.profile_out)
+        print(f'Profile written to {args.profile_out}')
+    if args.profile:
+        pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(args.top)
+
+
+def generate_input(day, size, seed=None):
+    generator = importlib.import_module(f'generators.day{day:02d}')
+    return generator.generate(size, seed)
+
+
+def count_elements(day, lines):
+    """
+    The number of elements in a generated input, which is what sweep growth exponents are fitted against.
+    That's one per line unless the day's generator says otherwise with a `size_of(lines)`.
+    """
+    generator = importlib.import_module(f'generators.day{day:02d}')
+    return getattr(generator, 'size_of', len)(lines)
+
+
+def write_input(file_path, lines):
+    with open(file_path, 'w') as file:
+        file.write('\n'.join(lines) + '\n')
+
+
+def sweep(solution, day, sizes, repeat=1, seed=None):
+    """
+    Time the solution on a synthetic input of each size, keeping the fastest of `repeat` runs.
+    The growth exponent is the slope of a least-squares fit of log(time) against log(n), where n is the
+    number of elements in the input (not `size`, which means e.g. the side of a grid for some days),
+    so O(n) shows up as roughly 1 and O(n^2) as roughly 2.
+    """
+    mode = get_input_mode(solution)
+    points = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            file_path = os.path.join(directory, f'input_{size}.txt')
+            lines = generate_input(day, size, seed)
+            write_input(file_path, lines)
+            timings = []
+            for _ in range(repeat):
+                data = load_input(file_path, mode)
+                start = time.perf_counter_ns()
+                answer = solution.run(data)
+                timings.append(time.perf_counter_ns() - start)
+            points.append({'size': size, 'n': count_elements(day, lines), 'answer': answer, 'solve_ns': min(timings)})
+    return {
+        'day': day,
+        'solution': solution.__name__.rsplit('.', 1)[-1],
+        'seed': seed,
+        'repeat': repeat,
+        'points': points,
+        'exponent': growth_exponent([(p['n'], p['solve_ns']) for p in points]),
+    }
+
+
+def growth_exponent(points):
+    points = [(math.log(n), math.log(ns)) for n, ns in points if n > 0 and ns > 0]
+    if len(points) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    return numerator / denominator if denominator else None
+
+
+def print_sweep(results):
+    print(f"{'Size':>12}  {'Elements':>12}  {'Time':>14}  Answer")
+    for p in results['points']:
+        print(f"{p['size']:>12}  {p['n']:>12}  {format_ns(p['solve_ns']):>14}  {p['answer']}")
+    exponent = results['exponent']
+    print(f"Growth exponent: {'n/a' if exponent is None else f'{exponent:.2f}'}")
+
+
+def parse_days(text):
+    """
+    Convert a day specification like "1-9" or "1,3,5-7" into a set of day numbers.
+    """
+    result = set()
+    for part in text.split(','):
+        start, _, stop = part.partition('-')
+        result.update(range(int(start), int(stop or start) + 1))
+    return result
+
+
+def discover_jobs(days=None):
+    """
+    Find every (day, solution, input) combination on disk, optionally limited to `days`.
+    """
+    result = []
+    for day_dir in sorted(os.listdir('.')):
+        day_match = day_pattern.fullmatch(day_dir)
+        if not day_match or not os.path.isdir(day_dir):
+            continue
+        day = int(day_match.group(1))
+        if days is not None and day not in days:
+            continue
+        file_names = sorted(os.listdir(day_dir))
+        solutions = [int(m.group(1)) for m in map(solution_pattern.fullmatch, file_names) if m]
+        input_ids = [m.group(1) for m in map(input_pattern.fullmatch, file_names) if m]
+        for solution in sorted(solutions):
+            for input_id in input_ids:
+                result.append((day, solution, input_id))
+    return result
+
+
+def run_jobs(jobs, timeout=None):
+    """
+    Fan the jobs out over a process pool sized to the CPU count.
+    Results come back in job order regardless of which finished first.
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(run_job, *job, timeout) for job in jobs]
+        return [f.result() for f in futures]
+
+
+def run_job(day, solution, input_id, timeout=None):
+    """
+    Run a single job inside a pool worker.
+    The time limit is enforced with an interval timer so a runaway job frees its worker.
+    Anything the solution prints is swallowed so it doesn't garble the results table.
+    """
+    result = {'day': day, 'solution': solution, 'input': input_id, 'answer': None, 'status': 'ok'}
+    if timeout:
+        signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    start = time.perf_counter_ns()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module = get_solution(day, solution)
+            result['answer'] = module.run(get_input(day, input_id, get_input_mode(module)))
+    except TimeoutError:
+        result['status'] = 'timeout'
+    except Exception as e:
+        result['status'] = f'error: {e!r}'
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    result['elapsed_ns'] = time.perf_counter_ns() - start
+    return result
+
+
+def raise_timeout(signum, frame):
+    raise TimeoutError()
+
+
+def print_results(results):
+    rows = [('Day', 'Part', 'Input', 'Answer', 'Time', 'Status')]
+    for r in results:
+        answer = '' if r['answer'] is None else str(r['answer'])
+        rows.append((str(r['day']), str(r['solution']), r['input'], answer, format_ns(r['elapsed_ns']), r['status']))
+    print_table(rows)
+
+
+def benchmark(solution, day, input_id, repeat):
+    """
+    Load the input once, then run the solution `repeat` times against it.
+    Loading the input is timed separately so it doesn't pollute the solve statistics.
+    A streamed input can only be consumed once, so it is read into a list up front (stream solutions accept
+    any iterable of lines). A mapped input isn't actually read until the solution runs, so its parse time is
+    reported as None and the solve times include the I/O.
+    """
+    mode = get_input_mode(solution)
+    start = time.perf_counter_ns()
+    lines = get_input(day, input_id, mode)
+    if mode == 'stream':
+        lines = list(lines)
+    parse_ns = time.perf_counter_ns() - start if mode != 'mmap' else None
+    answer, timings = None, []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        answer = solution.run(lines)
+        timings.append(time.perf_counter_ns() - start)
+    return {
+        'day': day,
+        'solution': solution.__name__.rsplit('.', 1)[-1],
+        'input': input_id,
+        'answer': answer,
+        'repeat': repeat,
+        'input_mode': mode,
+        'parse_ns': parse_ns,
+        'solve_ns': summarize_timings(timings),
+    }
+
+
+def summarize_timings(timings):
+    ordered = sorted(timings)
+    p95_index = max(0, -(-95 * len(ordered) // 100) - 1)
+    return {
+        'min': ordered[0],
+        'median': statistics.median(ordered),
+        'p95': ordered[p95_index],
+        'max': ordered[-1],
+        'stddev': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+def print_benchmark(results):
+    solve = results['solve_ns']
+    print(f"Answer: {results['answer']}")
+    print(f"Runs:   {results['repeat']}")
+    print(f"Parse:  {format_parse(results)}")
+    print(f"Solve:  min {format_ns(solve['min'])}  median {format_ns(solve['median'])}  "
+          f"p95 {format_ns(solve['p95'])}  stddev {format_ns(solve['stddev'])}")
+
+
+def print_comparison(results):
+    rows = [('Solution', 'Answer', 'Parse', 'Min', 'Median', 'p95')]
+    for r in results:
+        solve = r['solve_ns']
+        rows.append((r['solution'], str(r['answer']), format_parse(r),
+                     format_ns(solve['min']), format_ns(solve['median']), format_ns(solve['p95'])))
+    print_table(rows)
+
+
+def print_table(rows):
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print('  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+
+
+def format_ns(ns):
+    return f'{ns / 1_000_000:.3f} ms'
+
+
+def format_parse(results):
+    if results['parse_ns'] is None:
+        return f"n/a ({results['input_mode']}, included in solve)"
+    return format_ns(results['parse_ns'])
 
 
 def wrapup():
-    seconds = int(time.time() - start_time)
-    h, rem = divmod(seconds, 3600)
-    m, s = divmod(rem, 60)    
-    print(f"--- {h:02}:{m:02}:{s:02} elapsed ---")
+    seconds = time.perf_counter() - start_time
+    h, rem = divmod(int(seconds), 3600)
+    m, s = divmod(rem, 60)
+    ms = int((seconds % 1) * 1000)
+    print(f"--- {h:02}:{m:02}:{s:02}.{ms:03} elapsed ---")
 
 
 if __name__ == "__main__":